@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark Memori - Ukuran Sesi MemoryGame
+Measure per-session memory for many live MemoryGame sessions
+
+Usage:
+    python bench_memory_game.py [SESSIONS]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from memory_game import MemoryGame
+
+
+class NestedListSession:
+    """Session laid out like the original MemoryGame, for comparison"""
+
+    def __init__(self):
+        numbers = list(range(1, 7)) * 2
+        random.shuffle(numbers)
+        self.board = [numbers[i*4:(i+1)*4] for i in range(3)]
+        self.revealed = [[False for _ in range(4)] for _ in range(3)]
+        self.found_pairs = [(1, 1), (2, 2), (3, 3)]
+        self.attempts = 0
+        self.start_time = time.time()
+        self.first_card = None
+        self.second_card = None
+
+
+def compact_session():
+    """Create a MemoryGame halfway through a game"""
+    game = MemoryGame()
+    game.initialize_board()
+    for num in range(1, 4):
+        game.mark_found(num)
+    game.set_revealed(0, 0, True)
+    game.attempts = 5
+    return game
+
+
+def measure(factory, count):
+    """Get bytes allocated per session for count live sessions"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    sessions = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # Do not count the list that holds the sessions
+    total = after - before - sys.getsizeof(sessions)
+    del sessions
+    return total / count
+
+
+def main():
+    """Entry point"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    print(f"Sesi aktif: {count}\n")
+
+    for name, factory in [('nested lists', NestedListSession), ('MemoryGame', compact_session)]:
+        per_session = measure(factory, count)
+        print(f"{name:>14}: {per_session:8.1f} byte/sesi, "
+              f"{per_session * count / 1024 / 1024:8.1f} MiB total")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Leaderboard Lokal - Simpan Hasil Permainan
+SQLite-backed leaderboard shared by Memory Game and Sudoku Game
+"""
+
+import atexit
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+
+
+# Set this environment variable to keep the leaderboard somewhere else
+PATH_ENV = "HEI_LEADERBOARD_PATH"
+
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".hei_leaderboard.sqlite3")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    game TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    board_size TEXT NOT NULL,
+    elapsed_seconds INTEGER NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    hints INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_rank
+    ON results (game, difficulty, board_size, elapsed_seconds, attempts, hints);
+CREATE TABLE IF NOT EXISTS result_counts (
+    game TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    board_size TEXT NOT NULL,
+    elapsed_seconds INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (game, difficulty, board_size, elapsed_seconds)
+) WITHOUT ROWID;
+"""
+
+
+class Leaderboard:
+    def __init__(self, path=None, batch_size=64, flush_interval=0.5):
+        if path is None:
+            path = os.environ.get(PATH_ENV) or DEFAULT_PATH
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue()
+        self.closed = False
+
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        conn.close()
+
+        self.local = threading.local()
+        self.writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self.writer.start()
+        atexit.register(self.close)
+
+    def _connect(self):
+        """Open a connection in WAL mode so reads never wait on the writer"""
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _reader(self):
+        """Get the read connection for the calling thread"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self.local.conn = conn
+        return conn
+
+    def _writer_loop(self):
+        """Drain the queue and insert results in batches"""
+        conn = self._connect()
+        running = True
+
+        while running:
+            batch = []
+            waiters = []
+
+            try:
+                item = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            # Collect everything that is already waiting, up to batch_size
+            while True:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+
+                if len(batch) >= self.batch_size:
+                    break
+
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            try:
+                if batch:
+                    self._write_batch(conn, batch)
+            except sqlite3.Error as e:
+                # Drop the batch but keep the writer alive for later results
+                print(f"⚠️ Leaderboard: {len(batch)} hasil gagal disimpan ({e})", file=sys.stderr)
+            finally:
+                for event in waiters:
+                    event.set()
+
+        conn.close()
+
+    def _write_batch(self, conn, batch):
+        """Insert a batch of results in one transaction"""
+        with conn:
+            conn.executemany(
+                "INSERT INTO results (game, difficulty, board_size, elapsed_seconds,"
+                " attempts, hints, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                batch
+            )
+            # Keep a per-second histogram so percentiles never scan results
+            conn.executemany(
+                "INSERT INTO result_counts (game, difficulty, board_size, elapsed_seconds, count)"
+                " VALUES (?, ?, ?, ?, 1)"
+                " ON CONFLICT (game, difficulty, board_size, elapsed_seconds)"
+                " DO UPDATE SET count = count + 1",
+                [row[:4] for row in batch]
+            )
+
+    def record(self, game, difficulty, board_size, elapsed_seconds, attempts=0, hints=0):
+        """Queue a result; the write happens on the background thread"""
+        if self.closed or not self.writer.is_alive():
+            return
+        self.queue.put((game, difficulty, board_size, int(elapsed_seconds),
+                        attempts, hints, time.time()))
+
+    def flush(self):
+        """Block until every queued result has been written"""
+        if self.closed:
+            return
+        event = threading.Event()
+        self.queue.put(event)
+
+        # Give up if the writer thread has died
+        while not event.wait(self.flush_interval):
+            if not self.writer.is_alive():
+                return
+
+    def close(self):
+        """Write pending results and stop the writer thread"""
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.put(None)
+        self.writer.join()
+
+        conn = getattr(self.local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self.local.conn = None
+
+    def top(self, game, difficulty, board_size, k=10):
+        """Get the K best results (fastest, then fewest attempts and hints)"""
+        rows = self._reader().execute(
+            "SELECT elapsed_seconds, attempts, hints, created_at FROM results"
+            " WHERE game = ? AND difficulty = ? AND board_size = ?"
+            " ORDER BY elapsed_seconds, attempts, hints LIMIT ?",
+            (game, difficulty, board_size, k)
+        ).fetchall()
+
+        return [
+            {
+                'elapsed_seconds': row[0],
+                'attempts': row[1],
+                'hints': row[2],
+                'created_at': row[3]
+            }
+            for row in rows
+        ]
+
+    def percentile(self, game, difficulty, board_size, elapsed_seconds):
+        """Get the percentage of recorded results slower than elapsed_seconds
+        
+        Returns None when nothing has been recorded yet.
+        """
+        conn = self._reader()
+        key = (game, difficulty, board_size)
+
+        total = conn.execute(
+            "SELECT COALESCE(SUM(count), 0) FROM result_counts"
+            " WHERE game = ? AND difficulty = ? AND board_size = ?",
+            key
+        ).fetchone()[0]
+
+        if total == 0:
+            return None
+
+        slower = conn.execute(
+            "SELECT COALESCE(SUM(count), 0) FROM result_counts"
+            " WHERE game = ? AND difficulty = ? AND board_size = ? AND elapsed_seconds > ?",
+            key + (int(elapsed_seconds),)
+        ).fetchone()[0]
+
+        return 100.0 * slower / total
+
+
+def record_result(leaderboard, game, difficulty, board_size, elapsed_seconds,
+                  attempts=0, hints=0, k=5):
+    """Record a result and return (percentile, top K including this result)
+
+    The percentile and top K are read before the result is queued, and
+    the write is still pending, so the result is merged into the list here.
+    """
+    percentile = leaderboard.percentile(game, difficulty, board_size, elapsed_seconds)
+    top = leaderboard.top(game, difficulty, board_size, k=k)
+    leaderboard.record(game, difficulty, board_size, elapsed_seconds,
+                       attempts=attempts, hints=hints)
+
+    top.append({
+        'elapsed_seconds': int(elapsed_seconds),
+        'attempts': attempts,
+        'hints': hints,
+        'created_at': time.time()
+    })
+    top.sort(key=lambda r: (r['elapsed_seconds'], r['attempts'], r['hints']))
+
+    return percentile, top[:k]
+
+
+def format_seconds(seconds):
+    """Format seconds in MM:SS format"""
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
@@ -10,38 +10,206 @@ import time
 import os
 import sys
 
+from leaderboard import Leaderboard, format_seconds, record_result
+
+
+ROWS = 3
+COLS = 4
+PAIRS = (ROWS * COLS) // 2
+
+
+class _View:
+    """Base for list-like views over the packed MemoryGame state"""
+    __slots__ = ()
+
+    def __eq__(self, other):
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class _RowView(_View):
+    """View of one board row, reading and writing through the game"""
+    __slots__ = ('game', 'row')
+
+    def __init__(self, game, row):
+        self.game = game
+        self.row = row
+
+    def __len__(self):
+        return COLS
+
+    def __iter__(self):
+        return (self[col] for col in range(COLS))
+
+    def _col(self, col):
+        """Normalise col like a list index; raise IndexError if out of range"""
+        if col < 0:
+            col += COLS
+        if not 0 <= col < COLS:
+            raise IndexError("column index out of range")
+        return col
+
+
+class _BoardRow(_RowView):
+    """Board row that reads and writes the packed cells"""
+    __slots__ = ()
+
+    def __getitem__(self, col):
+        return self.game.get_card(self.row, self._col(col))
+
+    def __setitem__(self, col, value):
+        self.game.set_card(self.row, self._col(col), value)
+
+
+class _RevealedRow(_RowView):
+    """Board row that reads and writes the revealed bitmask"""
+    __slots__ = ()
+
+    def __getitem__(self, col):
+        return self.game.is_revealed(self.row, self._col(col))
+
+    def __setitem__(self, col, value):
+        self.game.set_revealed(self.row, self._col(col), value)
+
+
+class _FoundPairs(_View):
+    """Found pairs as (value, value) tuples, ordered by value"""
+    __slots__ = ('game',)
+
+    def __init__(self, game):
+        self.game = game
+
+    def __len__(self):
+        return self.game.count_found_pairs()
+
+    def __iter__(self):
+        found_mask = self.game.found_mask
+        return ((num, num) for num in range(1, PAIRS + 1) if found_mask >> num & 1)
+
+    def __getitem__(self, index):
+        return list(self)[index]
+
+    def __contains__(self, pair):
+        return pair in list(self)
+
+    def append(self, pair):
+        """Record a found pair; both values must be the same number"""
+        value1, value2 = pair
+        if value1 != value2:
+            raise ValueError(f"Bukan pasangan: {pair}")
+        self.game.mark_found(value1)
+
 
 class MemoryGame:
+    # Compact state so many sessions can live in memory at once:
+    # cells holds one byte per card, revealed_mask one bit per card and
+    # found_mask one bit per number whose pair has been found.
+    __slots__ = ('cells', 'revealed_mask', 'found_mask', 'attempts',
+                 'start_time', 'first_card', 'second_card')
+
     def __init__(self):
-        self.board = []
-        self.revealed = []
-        self.found_pairs = []
+        self.cells = b''
+        self.revealed_mask = 0
+        self.found_mask = 0
         self.attempts = 0
         self.start_time = None
         self.first_card = None
         self.second_card = None
 
+    @property
+    def board(self):
+        """Board as 3x4 rows that support board[row][col] = num"""
+        return [_BoardRow(self, row) for row in range(len(self.cells) // COLS)]
+
+    @board.setter
+    def board(self, board):
+        self.cells = bytes(num for row in board for num in row)
+
+    @property
+    def revealed(self):
+        """Revealed state as rows that support revealed[row][col] = True"""
+        return [_RevealedRow(self, row) for row in range(ROWS)]
+
+    @revealed.setter
+    def revealed(self, revealed):
+        self.revealed_mask = 0
+        for row, values in enumerate(revealed):
+            for col, value in enumerate(values):
+                self.set_revealed(row, col, value)
+
+    @property
+    def found_pairs(self):
+        """Found pairs as a view that supports len() and append()"""
+        return _FoundPairs(self)
+
+    @found_pairs.setter
+    def found_pairs(self, found_pairs):
+        self.found_mask = 0
+        for pair in found_pairs:
+            _FoundPairs(self).append(pair)
+
     def initialize_board(self):
         """Initialize the game board with numbers 1-6 appearing twice"""
-        numbers = list(range(1, 7)) * 2  # [1,2,3,4,5,6,1,2,3,4,5,6]
+        numbers = list(range(1, PAIRS + 1)) * 2  # [1,2,3,4,5,6,1,2,3,4,5,6]
         random.shuffle(numbers)
         
-        # Create 3x4 board (3 rows, 4 columns)
-        self.board = [numbers[i*4:(i+1)*4] for i in range(3)]
+        # 3x4 board (3 rows, 4 columns) stored row by row
+        self.cells = bytes(numbers)
         
-        # Initialize revealed state (False = hidden, True = revealed)
-        self.revealed = [[False for _ in range(4)] for _ in range(3)]
+        # All cards hidden
+        self.revealed_mask = 0
         
-        self.found_pairs = []
+        self.found_mask = 0
         self.attempts = 0
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+
+    def get_card(self, row, col):
+        """Get the number on the card at position"""
+        return self.cells[row * COLS + col]
+
+    def set_card(self, row, col, num):
+        """Put number num on the card at position"""
+        idx = row * COLS + col
+        self.cells = self.cells[:idx] + bytes((num,)) + self.cells[idx + 1:]
+
+    def is_revealed(self, row, col):
+        """Check if the card at position is face up"""
+        return bool(self.revealed_mask >> (row * COLS + col) & 1)
+
+    def set_revealed(self, row, col, value):
+        """Turn the card at position face up (True) or face down (False)"""
+        bit = 1 << (row * COLS + col)
+        if value:
+            self.revealed_mask |= bit
+        else:
+            self.revealed_mask &= ~bit
+
+    def mark_found(self, num):
+        """Record that the pair for num has been found"""
+        self.found_mask |= 1 << num
+
+    def count_found_pairs(self):
+        """Get the number of pairs found so far"""
+        return bin(self.found_mask).count('1')
+
+    def get_elapsed_seconds(self):
+        """Get elapsed time in whole seconds"""
+        if self.start_time is None:
+            return 0
+        
+        return int(time.monotonic() - self.start_time)
 
     def get_elapsed_time(self):
         """Get elapsed time in MM:SS format"""
         if self.start_time is None:
             return "00:00"
         
-        elapsed = int(time.time() - self.start_time)
+        elapsed = self.get_elapsed_seconds()
         minutes = elapsed // 60
         seconds = elapsed % 60
         
@@ -49,12 +217,18 @@ class MemoryGame:
 
     def is_game_complete(self):
         """Check if all pairs have been found"""
-        return len(self.found_pairs) == 6
+        return self.count_found_pairs() == PAIRS
 
 
 class MemoryUI:
-    def __init__(self):
+    def __init__(self, leaderboard_path=None):
         self.game = MemoryGame()
+        
+        try:
+            self.leaderboard = Leaderboard(leaderboard_path)
+        except Exception:
+            # Leaderboard is optional, the game still works without it
+            self.leaderboard = None
 
     def clear_screen(self):
         """Clear console screen"""
@@ -111,21 +285,21 @@ class MemoryUI:
     def print_board(self, show_all=False):
         """Print the current board state"""
         print("\n" + "=" * 50)
-        print(f"Waktu: {self.game.get_elapsed_time()} | Pasangan Ditemukan: {len(self.game.found_pairs)}/6 | Percobaan: {self.game.attempts}".center(50))
+        print(f"Waktu: {self.game.get_elapsed_time()} | Pasangan Ditemukan: {self.game.count_found_pairs()}/{PAIRS} | Percobaan: {self.game.attempts}".center(50))
         print("=" * 50 + "\n")
         
-        print("     0 1 2 3")
-        print("  +" + "-" * 13 + "+")
+        print("     " + " ".join(str(j) for j in range(COLS)))
+        print("  +" + "-" * (2 * COLS + 5) + "+")
         
-        for i in range(3):
+        for i in range(ROWS):
             row_str = f"{i} | "
-            for j in range(4):
+            for j in range(COLS):
                 if show_all:
                     # Show all numbers during memorization phase
-                    row_str += f"{self.game.board[i][j]} "
-                elif self.game.revealed[i][j]:
+                    row_str += f"{self.game.get_card(i, j)} "
+                elif self.game.is_revealed(i, j):
                     # Show revealed cards
-                    row_str += f"{self.game.board[i][j]} "
+                    row_str += f"{self.game.get_card(i, j)} "
                 else:
                     # Show hidden cards
                     row_str += "? "
@@ -133,7 +307,7 @@ class MemoryUI:
             row_str += "|"
             print(row_str)
         
-        print("  +" + "-" * 13 + "+\n")
+        print("  +" + "-" * (2 * COLS + 5) + "+\n")
 
     def memorization_phase(self):
         """Show all cards for memorization"""
@@ -168,8 +342,8 @@ class MemoryUI:
                 
                 row, col = int(parts[0]), int(parts[1])
                 
-                if not (0 <= row < 3 and 0 <= col < 4):
-                    print("❌ Posisi harus valid! Baris: 0-2, Kolom: 0-3")
+                if not (0 <= row < ROWS and 0 <= col < COLS):
+                    print(f"❌ Posisi harus valid! Baris: 0-{ROWS - 1}, Kolom: 0-{COLS - 1}")
                     continue
                 
                 return (row, col)
@@ -190,16 +364,16 @@ class MemoryUI:
             return False
         
         # Prevent selecting already revealed cards
-        if self.game.revealed[row1][col1] or self.game.revealed[row2][col2]:
+        if self.game.is_revealed(row1, col1) or self.game.is_revealed(row2, col2):
             print("❌ Salah satu atau kedua kartu sudah terbuka!")
             return False
         
         # Check if cards match
-        value1 = self.game.board[row1][col1]
-        value2 = self.game.board[row2][col2]
+        value1 = self.game.get_card(row1, col1)
+        value2 = self.game.get_card(row2, col2)
         
-        self.game.revealed[row1][col1] = True
-        self.game.revealed[row2][col2] = True
+        self.game.set_revealed(row1, col1, True)
+        self.game.set_revealed(row2, col2, True)
         self.game.attempts += 1
         
         self.clear_screen()
@@ -211,14 +385,14 @@ class MemoryUI:
         
         if value1 == value2:
             print("✅ BENAR! Pasangan ditemukan!\n")
-            self.game.found_pairs.append((value1, value2))
+            self.game.mark_found(value1)
             time.sleep(2)
             return True
         else:
             print("❌ SALAH! Kartu tidak cocok.\n")
             # Hide the cards again
-            self.game.revealed[row1][col1] = False
-            self.game.revealed[row2][col2] = False
+            self.game.set_revealed(row1, col1, False)
+            self.game.set_revealed(row2, col2, False)
             time.sleep(2)
             return False
 
@@ -239,17 +413,17 @@ class MemoryUI:
             
             # Reveal first card
             row1, col1 = pos1
-            self.game.revealed[row1][col1] = True
+            self.game.set_revealed(row1, col1, True)
             
             self.clear_screen()
             self.print_header()
             self.print_board(show_all=False)
-            print(f"Kartu 1: ({row1}, {col1}) = {self.game.board[row1][col1]}\n")
+            print(f"Kartu 1: ({row1}, {col1}) = {self.game.get_card(row1, col1)}\n")
             
             # Get second card
             pos2 = self.get_card_input(2)
             if pos2 is None:
-                self.game.revealed[row1][col1] = False
+                self.game.set_revealed(row1, col1, False)
                 return
             
             # Check the pair
@@ -261,6 +435,7 @@ class MemoryUI:
     def show_win_screen(self):
         """Show win screen with stats"""
         elapsed_time = self.game.get_elapsed_time()
+        elapsed_seconds = self.game.get_elapsed_seconds()
         
         self.clear_screen()
         self.print_header()
@@ -269,11 +444,34 @@ class MemoryUI:
         print("=" * 50)
         print(f"Waktu: {elapsed_time}".center(50))
         print(f"Total Percobaan: {self.game.attempts}".center(50))
-        print(f"Pasangan Ditemukan: {len(self.game.found_pairs)}/6".center(50))
+        print(f"Pasangan Ditemukan: {self.game.count_found_pairs()}/{PAIRS}".center(50))
         print("=" * 50 + "\n")
         
+        self.print_leaderboard(elapsed_seconds)
+        
         input("Tekan ENTER untuk kembali ke menu...")
 
+    def print_leaderboard(self, elapsed_seconds):
+        """Record the result and print the top 5 results"""
+        if self.leaderboard is None:
+            return
+        
+        try:
+            percentile, top = record_result(self.leaderboard, 'memory', 'normal', f"{ROWS}x{COLS}",
+                                            elapsed_seconds, attempts=self.game.attempts)
+        except Exception as e:
+            print(f"⚠️ Leaderboard tidak tersedia: {e}\n")
+            return
+        
+        if percentile is not None:
+            print(f"Lebih cepat dari {percentile:.0f}% permainan sebelumnya".center(50))
+        print("\n🏆 PAPAN PERINGKAT 🏆".center(50))
+        
+        for rank, result in enumerate(top, 1):
+            print(f"{rank}. {format_seconds(result['elapsed_seconds'])} - "
+                  f"{result['attempts']} percobaan".center(50))
+        print()
+
     def run(self):
         """Run the game"""
         while True:
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sudoku Batch Solver - Selesaikan Banyak Puzzle Sekaligus
+Solve puzzle files (one 81-char line per puzzle) across worker processes
+
+Usage:
+    python sudoku_batch.py puzzles.txt -o solutions.txt --workers 4
+
+Each output line is: SOLUTION<TAB>STATUS<TAB>MILLISECONDS, one per input
+line and in input order. STATUS is 'unique', 'multiple', 'none' or
+'invalid' (blank and malformed lines are invalid).
+"""
+
+import argparse
+import mmap
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from sudoku_game import SudokuGame
+
+
+EMPTY_SOLUTION = "." * 81
+
+_game = SudokuGame()
+
+
+def parse_puzzle(line):
+    """Parse an 81-char puzzle line ('0' or '.' for empty) into a 9x9 board"""
+    if len(line) != 81:
+        return None
+
+    cells = []
+    for char in line:
+        if char in '.0':
+            cells.append(0)
+        elif '1' <= char <= '9':
+            cells.append(int(char))
+        else:
+            return None
+
+    return [cells[i:i + 9] for i in range(0, 81, 9)]
+
+
+def solve_line(line):
+    """Solve one puzzle line and return its output line"""
+    start = time.perf_counter()
+    board = parse_puzzle(line)
+
+    if board is None:
+        solution, status = EMPTY_SOLUTION, 'invalid'
+    else:
+        solutions = list(_game.iter_solutions(board, limit=2))
+        if not solutions:
+            solution, status = EMPTY_SOLUTION, 'none'
+        else:
+            solution = "".join(str(num) for row in solutions[0] for num in row)
+            status = 'unique' if len(solutions) == 1 else 'multiple'
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return f"{solution}\t{status}\t{elapsed_ms:.3f}\n"
+
+
+def solve_chunk(lines):
+    """Solve a chunk of puzzle lines in a worker process"""
+    return "".join(solve_line(line) for line in lines)
+
+
+def read_lines(path, use_mmap=False):
+    """Stream stripped lines from a puzzle file
+
+    Blank lines are kept (and reported as invalid) so output line N
+    always belongs to input line N.
+    """
+    with open(path, 'rb') as f:
+        if use_mmap and os.path.getsize(path) > 0:
+            source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            lines = iter(source.readline, b'')
+        else:
+            source = None
+            lines = f
+
+        try:
+            for raw in lines:
+                yield raw.strip().decode('ascii', errors='replace')
+        finally:
+            if source is not None:
+                source.close()
+
+
+def read_chunks(lines, chunk_size):
+    """Group lines into lists of at most chunk_size"""
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def solve_file(input_path, output, workers=None, chunk_size=1000, use_mmap=False, max_in_flight=None):
+    """Solve every puzzle in input_path, writing results to output in order
+
+    At most max_in_flight chunks are queued at once, so memory use does
+    not grow with the size of the file. Returns the number of puzzles.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if max_in_flight is None:
+        max_in_flight = workers * 2
+
+    total = 0
+    pending = deque()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in read_chunks(read_lines(input_path, use_mmap), chunk_size):
+            # Wait for the oldest chunk before queueing more work
+            if len(pending) >= max_in_flight:
+                output.write(pending.popleft().result())
+
+            pending.append(executor.submit(solve_chunk, chunk))
+            total += len(chunk)
+
+        while pending:
+            output.write(pending.popleft().result())
+
+    return total
+
+
+def main():
+    """Entry point"""
+    parser = argparse.ArgumentParser(description="Selesaikan banyak puzzle Sudoku dari file.")
+    parser.add_argument('input', help="file puzzle, satu baris 81 karakter per puzzle")
+    parser.add_argument('-o', '--output', help="file hasil (default: stdout)")
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help="jumlah proses (default: jumlah CPU)")
+    parser.add_argument('-c', '--chunk-size', type=int, default=1000,
+                        help="jumlah puzzle per chunk (default: 1000)")
+    parser.add_argument('--max-in-flight', type=int, default=None,
+                        help="maksimum chunk yang diproses bersamaan (default: 2x workers)")
+    parser.add_argument('--mmap', action='store_true', help="baca file dengan memory-map")
+    args = parser.parse_args()
+
+    if args.chunk_size < 1:
+        parser.error("--chunk-size harus lebih dari 0")
+
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers harus lebih dari 0")
+
+    if args.max_in_flight is not None and args.max_in_flight < 1:
+        parser.error("--max-in-flight harus lebih dari 0")
+
+    # Check the input before the output is created, so a bad path leaves no empty file
+    if not os.path.isfile(args.input):
+        parser.error(f"file tidak ditemukan: {args.input}")
+
+    output = open(args.output, 'w') if args.output else sys.stdout
+    start = time.perf_counter()
+
+    try:
+        total = solve_file(args.input, output, args.workers, args.chunk_size,
+                           args.mmap, args.max_in_flight)
+    except OSError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    elapsed = time.perf_counter() - start
+    rate = total / elapsed if elapsed > 0 else 0
+    print(f"✓ {total} puzzle selesai dalam {elapsed:.2f} detik ({rate:.1f} puzzle/detik)",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
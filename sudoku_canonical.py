@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bentuk Kanonik Sudoku - Deteksi Puzzle Duplikat
+Canonical form under the Sudoku symmetry group and a dedup index over it
+
+Two puzzles are equivalent when one can be turned into the other by
+transposing, permuting bands, rows within a band, stacks, columns within
+a stack, and relabeling digits. The canonical form is the lexicographically
+smallest grid (blanks first) among all equivalent ones.
+"""
+
+import hashlib
+from itertools import permutations
+from operator import itemgetter
+
+
+# All 6^4 = 1296 column orders: stack order, then column order per stack
+COLUMN_PERMS = [
+    tuple(3 * stack + offset
+          for stack, inner in zip(stacks, inners)
+          for offset in inner)
+    for stacks in permutations(range(3))
+    for inners in (
+        (a, b, c)
+        for a in permutations(range(3))
+        for b in permutations(range(3))
+        for c in permutations(range(3))
+    )
+]
+
+COLUMN_GETTERS = [itemgetter(*perm) for perm in COLUMN_PERMS]
+
+
+def _flatten(board):
+    """Turn a 9x9 board or an 81-char string into a tuple of 81 ints"""
+    if isinstance(board, str):
+        return tuple(0 if char in '.0' else int(char) for char in board)
+    return tuple(cell for row in board for cell in row)
+
+
+def _without(rows, index):
+    """Copy of a tuple of rows with one row removed"""
+    return rows[:index] + rows[index + 1:]
+
+
+def _relabel(cells, mapping, next_label):
+    """Relabel digits in order of first appearance, extending mapping"""
+    mapping = list(mapping)
+    out = []
+
+    for num in cells:
+        if num and not mapping[num]:
+            mapping[num] = next_label
+            next_label += 1
+        out.append(mapping[num])
+
+    return tuple(out), mapping, next_label
+
+
+def canonical_form(board):
+    """Get the canonical 81-char string ('0' for blanks) of a board
+
+    Rows are fixed one at a time; only the transforms whose prefix equals
+    the smallest prefix found so far are kept, so most of the 3.3 million
+    grid transforms are never built. A state only records which rows are
+    left and how they are grouped into bands, so transforms that differ
+    only by the order of equal rows (e.g. blank ones) are merged.
+    """
+    grid = _flatten(board)
+    if len(grid) != 81:
+        raise ValueError("Board harus berisi 81 sel")
+
+    grid_rows = [grid[row * 9:row * 9 + 9] for row in range(9)]
+    grid_cols = [grid[col::9] for col in range(9)]
+
+    # Each state: (rows left in the current band, bands not started yet,
+    # digit mapping, next label). Rows and bands are kept sorted so equal
+    # states compare equal.
+    states = set()
+    for variant in (grid_rows, grid_cols):
+        for getter in COLUMN_GETTERS:
+            bands = tuple(sorted(
+                tuple(sorted(getter(row) for row in variant[band * 3:band * 3 + 3]))
+                for band in range(3)
+            ))
+            states.add(((), bands, (0,) * 10, 1))
+
+    result = []
+
+    for _ in range(9):
+        best = None
+        next_states = set()
+
+        for open_rows, bands, mapping, next_label in states:
+            if open_rows:
+                choices = [(open_rows, bands)]
+            else:
+                # Start a new band
+                choices = [(band, _without(bands, index)) for index, band in enumerate(bands)]
+
+            for band_rows, rest in choices:
+                for index, row in enumerate(band_rows):
+                    cells, new_mapping, new_next = _relabel(row, mapping, next_label)
+
+                    if best is None or cells < best:
+                        best = cells
+                        next_states = set()
+
+                    if cells == best:
+                        next_states.add((_without(band_rows, index), rest,
+                                         tuple(new_mapping), new_next))
+
+        result.extend(best)
+        states = next_states
+
+    return "".join(str(num) for num in result)
+
+
+def canonical_key(board):
+    """Get a compact 16-byte hash of the canonical form"""
+    return hashlib.blake2b(canonical_form(board).encode('ascii'), digest_size=16).digest()
+
+
+class PuzzleIndex:
+    def __init__(self):
+        # canonical key -> first puzzle seen, 81 bytes in row order (0 = blank)
+        self.puzzles = {}
+
+    def add(self, board):
+        """Add a puzzle; return False if an equivalent puzzle is already stored"""
+        key = canonical_key(board)
+        if key in self.puzzles:
+            return False
+
+        self.puzzles[key] = bytes(_flatten(board))
+        return True
+
+    def find(self, board):
+        """Get the stored puzzle equivalent to board as 81 bytes, or None"""
+        return self.puzzles.get(canonical_key(board))
+
+    def __contains__(self, board):
+        return canonical_key(board) in self.puzzles
+
+    def __len__(self):
+        return len(self.puzzles)
@@ -9,7 +9,16 @@ import random
 import time
 import os
 import sys
-from copy import deepcopy
+
+from leaderboard import Leaderboard, format_seconds, record_result
+from sudoku_canonical import PuzzleIndex
+
+
+# Number of candidates in a 10-bit candidate mask
+CANDIDATE_COUNTS = [bin(mask).count('1') for mask in range(1 << 10)]
+
+# Row, column and box of every cell index 0-80
+CELL_UNITS = [(idx // 9, idx % 9, (idx // 27) * 3 + (idx % 9) // 3) for idx in range(81)]
 
 
 class SudokuGame:
@@ -21,8 +30,22 @@ class SudokuGame:
         self.difficulty = None
         self.hints_used = 0
 
-    def generate_puzzle(self, difficulty):
-        """Generate Sudoku puzzle berdasarkan difficulty level"""
+    def generate_puzzle(self, difficulty, index=None, max_attempts=10):
+        """Generate Sudoku puzzle berdasarkan difficulty level
+        
+        If a PuzzleIndex is given, puzzles equivalent to one already in
+        the index are thrown away and generated again, up to max_attempts
+        times. After that the last puzzle is kept even if it is a duplicate.
+        At least one puzzle is always generated.
+        """
+        for _ in range(max(1, max_attempts)):
+            self.create_puzzle(difficulty)
+            
+            if index is None or index.add(self.original_board):
+                break
+
+    def create_puzzle(self, difficulty):
+        """Create one new puzzle berdasarkan difficulty level"""
         self.difficulty = difficulty
         
         # Generate solved board
@@ -54,7 +77,7 @@ class SudokuGame:
                 self.board[row][col] = 0
                 
                 # Check if puzzle still has unique solution
-                if self.count_solutions(deepcopy(self.board)) == 1:
+                if self.count_solutions(self.board) == 1:
                     self.original_board[row][col] = 0
                     removed += 1
                 else:
@@ -110,21 +133,108 @@ class SudokuGame:
 
     def count_solutions(self, board):
         """Count number of solutions (max 2 for performance)"""
-        for row in range(9):
-            for col in range(9):
-                if board[row][col] == 0:
-                    count = 0
-                    for num in range(1, 10):
-                        if self.is_valid(board, row, col, num):
-                            board[row][col] = num
-                            count += self.count_solutions(board)
-                            if count > 1:
-                                board[row][col] = 0
-                                return count
-                            board[row][col] = 0
-                    return count
+        return sum(1 for _ in self.iter_solutions(board, limit=2))
+
+    def iter_solutions(self, board, limit=None, time_budget=None):
+        """Lazily yield solutions of a partial board
+        
+        Stops after `limit` solutions or `time_budget` seconds. The board
+        is not modified; each solution is yielded as a new 9x9 list.
+        """
+        if limit is not None and limit <= 0:
+            return
+        
+        deadline = None
+        if time_budget is not None:
+            deadline = time.monotonic() + time_budget
+        
+        # Bit n of each mask is set when number n is used in that unit
+        grid = [cell for row in board for cell in row]
+        rows = [0] * 9
+        cols = [0] * 9
+        boxes = [0] * 9
+        empty = []
+        
+        for idx, num in enumerate(grid):
+            if num == 0:
+                empty.append(idx)
+                continue
+            
+            row, col, box = CELL_UNITS[idx]
+            bit = 1 << num
+            
+            # Conflicting givens have no solution
+            if (rows[row] | cols[col] | boxes[box]) & bit:
+                return
+            
+            rows[row] |= bit
+            cols[col] |= bit
+            boxes[box] |= bit
+        
+        if not empty:
+            yield [grid[i:i + 9] for i in range(0, 81, 9)]
+            return
+        
+        def next_cell():
+            # Pick the empty cell with the fewest candidates
+            best = None
+            best_mask = 0
+            best_count = 10
+            
+            for idx in empty:
+                if grid[idx] != 0:
+                    continue
+                
+                row, col, box = CELL_UNITS[idx]
+                mask = 0b1111111110 & ~(rows[row] | cols[col] | boxes[box])
+                count = CANDIDATE_COUNTS[mask]
+                
+                if count < best_count:
+                    best, best_mask, best_count = idx, mask, count
+                    if count <= 1:
+                        break
+            
+            return [best, best_mask]
+        
+        # Explicit stack of [cell, untried candidates]; depth is at most 81
+        stack = [next_cell()]
+        found = 0
         
-        return 1
+        while stack:
+            if deadline is not None and time.monotonic() > deadline:
+                return
+            
+            frame = stack[-1]
+            idx, mask = frame
+            row, col, box = CELL_UNITS[idx]
+            
+            # Undo the number tried previously in this cell
+            if grid[idx] != 0:
+                bit = 1 << grid[idx]
+                rows[row] &= ~bit
+                cols[col] &= ~bit
+                boxes[box] &= ~bit
+                grid[idx] = 0
+            
+            if not mask:
+                stack.pop()
+                continue
+            
+            bit = mask & -mask
+            frame[1] = mask & ~bit
+            grid[idx] = bit.bit_length() - 1
+            rows[row] |= bit
+            cols[col] |= bit
+            boxes[box] |= bit
+            
+            if len(stack) == len(empty):
+                yield [grid[i:i + 9] for i in range(0, 81, 9)]
+                found += 1
+                if limit is not None and found >= limit:
+                    return
+                continue
+            
+            stack.append(next_cell())
 
     def is_complete(self):
         """Check if board is completely filled"""
@@ -167,12 +277,19 @@ class SudokuGame:
         
         return hint
 
+    def get_elapsed_seconds(self):
+        """Get elapsed time in whole seconds"""
+        if self.start_time is None:
+            return 0
+        
+        return int(time.time() - self.start_time)
+
     def get_elapsed_time(self):
         """Get elapsed time in MM:SS format"""
         if self.start_time is None:
             return "00:00"
         
-        elapsed = int(time.time() - self.start_time)
+        elapsed = self.get_elapsed_seconds()
         minutes = elapsed // 60
         seconds = elapsed % 60
         
@@ -180,8 +297,15 @@ class SudokuGame:
 
 
 class SudokuUI:
-    def __init__(self):
+    def __init__(self, leaderboard_path=None):
         self.game = SudokuGame()
+        self.served_puzzles = PuzzleIndex()
+        
+        try:
+            self.leaderboard = Leaderboard(leaderboard_path)
+        except Exception:
+            # Leaderboard is optional, the game still works without it
+            self.leaderboard = None
 
     def clear_screen(self):
         """Clear console screen"""
@@ -346,6 +470,29 @@ class SudokuUI:
             print("\n❌ Ada yang salah! Periksa kembali jawaban Anda.")
             return False
 
+    def print_leaderboard(self, elapsed_seconds):
+        """Record the result and print the top 5 results for this level"""
+        if self.leaderboard is None:
+            return
+        
+        difficulty = self.game.difficulty
+        
+        try:
+            percentile, top = record_result(self.leaderboard, 'sudoku', difficulty, '9x9',
+                                            elapsed_seconds, hints=self.game.hints_used)
+        except Exception as e:
+            print(f"⚠️ Leaderboard tidak tersedia: {e}\n")
+            return
+        
+        if percentile is not None:
+            print(f"Lebih cepat dari {percentile:.0f}% permainan sebelumnya".center(50))
+        print(f"\n🏆 PAPAN PERINGKAT - {difficulty.upper()} 🏆".center(50))
+        
+        for rank, result in enumerate(top, 1):
+            print(f"{rank}. {format_seconds(result['elapsed_seconds'])} - "
+                  f"{result['hints']} hints".center(50))
+        print()
+
     def play_game(self, difficulty):
         """Main game loop"""
         self.clear_screen()
@@ -357,7 +504,7 @@ class SudokuUI:
         }
         
         diff = difficulty_names.get(difficulty, 'mudah')
-        self.game.generate_puzzle(diff)
+        self.game.generate_puzzle(diff, self.served_puzzles)
         self.game.start_time = time.time()
         
         while True:
@@ -382,6 +529,8 @@ class SudokuUI:
                     print(f"Hints yang digunakan: {self.game.hints_used}".center(50))
                     print("\n")
                     
+                    self.print_leaderboard(self.game.get_elapsed_seconds())
+                    
                     while True:
                         choice = input("Mainkan lagi? (y/n): ").strip().lower()
                         if choice in ['y', 'n']:
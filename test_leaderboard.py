@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tes Leaderboard
+Batched writes must land in order and survive SQLite errors
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+from leaderboard import PATH_ENV, Leaderboard, record_result
+
+
+class LeaderboardTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'leaderboard.sqlite3')
+        self.leaderboard = Leaderboard(self.path, flush_interval=0.05)
+
+    def tearDown(self):
+        self.leaderboard.close()
+        shutil.rmtree(self.dir)
+
+    def record_all(self, results, game='sudoku'):
+        for elapsed, attempts, hints in results:
+            self.leaderboard.record(game, 'mudah', '9x9', elapsed, attempts=attempts, hints=hints)
+        self.leaderboard.flush()
+
+    def ranking(self, k=10):
+        return [(r['elapsed_seconds'], r['attempts'], r['hints'])
+                for r in self.leaderboard.top('sudoku', 'mudah', '9x9', k=k)]
+
+    def test_top_order(self):
+        self.record_all([(30, 0, 0), (10, 5, 0), (10, 3, 1), (10, 3, 0), (20, 0, 2)])
+        self.record_all([(5, 0, 0)], game='memory')
+
+        self.assertEqual(self.ranking(),
+                         [(10, 3, 0), (10, 3, 1), (10, 5, 0), (20, 0, 2), (30, 0, 0)])
+        self.assertEqual(self.ranking(k=2), [(10, 3, 0), (10, 3, 1)])
+
+    def test_percentile_without_results(self):
+        self.assertIsNone(self.leaderboard.percentile('sudoku', 'mudah', '9x9', 10))
+
+    def test_percentile_counts_strictly_slower(self):
+        self.record_all([(10, 0, 0), (20, 0, 0), (20, 0, 0), (30, 0, 0)])
+
+        self.assertEqual(self.leaderboard.percentile('sudoku', 'mudah', '9x9', 20), 25.0)
+        self.assertEqual(self.leaderboard.percentile('sudoku', 'mudah', '9x9', 5), 100.0)
+        self.assertEqual(self.leaderboard.percentile('sudoku', 'mudah', '9x9', 30), 0.0)
+        self.assertIsNone(self.leaderboard.percentile('sudoku', 'sulit', '9x9', 20))
+
+    def test_counts_duplicate_seconds(self):
+        self.record_all([(20, 0, 0), (20, 1, 0), (20, 0, 3), (25, 0, 0)])
+
+        counts = self.leaderboard._reader().execute(
+            "SELECT elapsed_seconds, count FROM result_counts"
+            " WHERE game = 'sudoku' ORDER BY elapsed_seconds"
+        ).fetchall()
+        self.assertEqual(counts, [(20, 3), (25, 1)])
+
+    def test_write_error_keeps_writer_alive(self):
+        error = sqlite3.OperationalError("disk I/O error")
+        with mock.patch.object(self.leaderboard, '_write_batch', side_effect=error), \
+                mock.patch('sys.stderr'):
+            self.record_all([(10, 0, 0)])
+
+        self.assertTrue(self.leaderboard.writer.is_alive())
+        self.assertEqual(self.ranking(), [])
+
+        self.record_all([(15, 0, 0)])
+        self.assertEqual(self.ranking(), [(15, 0, 0)])
+
+    def test_record_after_close(self):
+        self.leaderboard.close()
+        self.leaderboard.record('sudoku', 'mudah', '9x9', 10)
+        self.leaderboard.flush()
+
+        self.assertTrue(self.leaderboard.queue.empty())
+        conn = sqlite3.connect(self.path)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM results").fetchone()[0], 0)
+        conn.close()
+
+    def test_record_result(self):
+        self.record_all([(10, 0, 0), (30, 0, 0)])
+
+        percentile, top = record_result(self.leaderboard, 'sudoku', 'mudah', '9x9', 20,
+                                        hints=1, k=2)
+
+        self.assertEqual(percentile, 50.0)
+        self.assertEqual([(r['elapsed_seconds'], r['hints']) for r in top], [(10, 0), (20, 1)])
+
+        self.leaderboard.flush()
+        self.assertEqual(self.ranking(), [(10, 0, 0), (20, 0, 1), (30, 0, 0)])
+
+    def test_path_from_environment(self):
+        path = os.path.join(self.dir, 'env.sqlite3')
+        with mock.patch.dict(os.environ, {PATH_ENV: path}):
+            leaderboard = Leaderboard()
+        leaderboard.close()
+
+        self.assertEqual(leaderboard.path, path)
+        self.assertTrue(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tes Memory Game
+Compact MemoryGame state must keep the list-based board API working
+"""
+
+from collections import Counter
+import unittest
+
+from memory_game import COLS, PAIRS, ROWS, MemoryGame
+
+
+class RowViewTest(unittest.TestCase):
+    def setUp(self):
+        self.game = MemoryGame()
+        self.game.board = [[1, 2, 3, 4], [5, 6, 1, 2], [3, 4, 5, 6]]
+
+    def test_negative_index(self):
+        self.assertEqual(self.game.board[1][-1], 2)
+
+        self.game.board[1][-1] = 6
+        self.assertEqual(self.game.board[1][3], 6)
+        self.assertEqual(self.game.board[0][3], 4)
+
+    def test_index_out_of_range(self):
+        with self.assertRaises(IndexError):
+            self.game.board[0][COLS]
+        with self.assertRaises(IndexError):
+            self.game.board[0][-COLS - 1]
+        with self.assertRaises(IndexError):
+            self.game.revealed[0][COLS] = True
+
+    def test_revealed_negative_index(self):
+        self.assertFalse(self.game.revealed[0][-1])
+
+        self.game.revealed[1][-1] = True
+        self.assertTrue(self.game.is_revealed(1, COLS - 1))
+        self.assertFalse(self.game.is_revealed(0, COLS - 1))
+
+
+class CompatibilityTest(unittest.TestCase):
+    def setUp(self):
+        self.game = MemoryGame()
+
+    def test_initialize_board(self):
+        self.game.initialize_board()
+        cards = [card for row in self.game.board for card in row]
+
+        self.assertEqual(len(cards), ROWS * COLS)
+        self.assertEqual(Counter(cards), {num: 2 for num in range(1, PAIRS + 1)})
+        self.assertFalse(any(any(row) for row in self.game.revealed))
+        self.assertEqual(len(self.game.found_pairs), 0)
+
+    def test_board_round_trip(self):
+        board = [[1, 2, 3, 4], [5, 6, 1, 2], [3, 4, 5, 6]]
+        self.game.board = board
+
+        self.assertEqual(self.game.board, board)
+        self.assertEqual(self.game.get_card(2, 1), 4)
+
+    def test_revealed_round_trip(self):
+        revealed = [[True, False, False, True], [False] * COLS, [False, True, False, False]]
+        self.game.revealed = revealed
+
+        self.assertEqual(self.game.revealed, revealed)
+        self.assertTrue(self.game.is_revealed(2, 1))
+        self.assertFalse(self.game.is_revealed(1, 1))
+
+    def test_found_pairs_append(self):
+        self.game.initialize_board()
+
+        for num in range(1, PAIRS + 1):
+            self.assertFalse(self.game.is_game_complete())
+            self.game.found_pairs.append((num, num))
+            self.assertEqual(len(self.game.found_pairs), num)
+            self.assertIn((num, num), self.game.found_pairs)
+
+        self.assertTrue(self.game.is_game_complete())
+
+    def test_found_pairs_rejects_mismatch(self):
+        with self.assertRaises(ValueError):
+            self.game.found_pairs.append((1, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tes Sudoku Batch Solver
+Puzzle lines must parse strictly and results must come back in input order
+"""
+
+import io
+import os
+import random
+import tempfile
+import unittest
+
+from sudoku_batch import parse_puzzle, read_lines, solve_file
+from sudoku_game import SudokuGame
+
+
+def to_line(board):
+    """Turn a 9x9 board into an 81-char line with '.' for blanks"""
+    return "".join(str(num) if num else '.' for row in board for num in row)
+
+
+class BatchTestCase(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.txt')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def write(self, data):
+        with open(self.path, 'wb') as f:
+            f.write(data)
+
+
+class ParsePuzzleTest(unittest.TestCase):
+    def test_blanks(self):
+        board = parse_puzzle("1" + "." * 40 + "0" * 39 + "9")
+
+        self.assertEqual(board[0][0], 1)
+        self.assertEqual(board[8][8], 9)
+        self.assertEqual(sum(num for row in board for num in row), 10)
+
+    def test_wrong_length(self):
+        self.assertIsNone(parse_puzzle("." * 80))
+        self.assertIsNone(parse_puzzle("." * 82))
+        self.assertIsNone(parse_puzzle(""))
+
+    def test_bad_characters(self):
+        self.assertIsNone(parse_puzzle("x" + "." * 80))
+        self.assertIsNone(parse_puzzle(" " + "." * 80))
+
+
+class ReadLinesTest(BatchTestCase):
+    def test_blank_lines_and_crlf(self):
+        self.write(b"abc\r\n\r\n" + b"." * 81 + b"\nlast")
+
+        for use_mmap in (False, True):
+            self.assertEqual(list(read_lines(self.path, use_mmap)),
+                             ["abc", "", "." * 81, "last"])
+
+    def test_empty_file(self):
+        self.write(b"")
+
+        for use_mmap in (False, True):
+            self.assertEqual(list(read_lines(self.path, use_mmap)), [])
+
+
+class SolveFileTest(BatchTestCase):
+    def setUp(self):
+        super().setUp()
+        random.seed(2028)
+        self.game = SudokuGame()
+
+    def solve(self, lines, **kwargs):
+        self.write("".join(line + "\n" for line in lines).encode('ascii'))
+        output = io.StringIO()
+        total = solve_file(self.path, output, **kwargs)
+
+        results = [line.split("\t") for line in output.getvalue().splitlines()]
+        self.assertEqual(total, len(lines))
+        self.assertEqual(len(results), len(lines))
+        return results
+
+    def test_statuses(self):
+        self.game.generate_puzzle('mudah')
+        lines = [
+            to_line(self.game.original_board),
+            "." * 81,
+            "11" + "." * 79,
+            "not a puzzle",
+            "",
+        ]
+
+        results = self.solve(lines, workers=1)
+
+        self.assertEqual([status for _, status, _ in results],
+                         ['unique', 'multiple', 'none', 'invalid', 'invalid'])
+        self.assertEqual(results[0][0], to_line(self.game.solution))
+        self.assertEqual(results[2][0], "." * 81)
+        self.assertEqual(results[3][0], "." * 81)
+
+    def test_order_with_workers(self):
+        solutions = [self.game.generate_solved_board() for _ in range(12)]
+        lines = []
+        for solution in solutions:
+            # Blank a few cells so every line still has a single solution
+            board = [row[:] for row in solution]
+            board[0][0] = board[4][4] = board[8][8] = 0
+            lines.append(to_line(board))
+
+        results = self.solve(lines, workers=2, chunk_size=2, max_in_flight=1, use_mmap=True)
+
+        self.assertEqual([solution for solution, _, _ in results],
+                         [to_line(solution) for solution in solutions])
+        self.assertTrue(all(status == 'unique' for _, status, _ in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
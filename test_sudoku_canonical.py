@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tes Bentuk Kanonik Sudoku
+Canonical form must not change under Sudoku symmetry transforms
+"""
+
+import random
+import time
+import unittest
+
+from sudoku_canonical import PuzzleIndex, canonical_form
+from sudoku_game import SudokuGame
+
+
+def random_transform(board, rng):
+    """Apply a random transpose, row/column shuffle and relabeling"""
+    grid = [row[:] for row in board]
+
+    if rng.random() < 0.5:
+        grid = [list(row) for row in zip(*grid)]
+
+    def shuffled_indices():
+        bands = rng.sample(range(3), 3)
+        return [band * 3 + offset for band in bands for offset in rng.sample(range(3), 3)]
+
+    rows = shuffled_indices()
+    cols = shuffled_indices()
+    labels = [0] + rng.sample(range(1, 10), 9)
+
+    return [[labels[grid[row][col]] for col in cols] for row in rows]
+
+
+class CanonicalFormTest(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(2026)
+        random.seed(2026)
+        self.game = SudokuGame()
+
+    def assert_invariant(self, board, transforms=5):
+        expected = canonical_form(board)
+        for _ in range(transforms):
+            self.assertEqual(canonical_form(random_transform(board, self.rng)), expected)
+
+    def test_generated_puzzle(self):
+        self.game.generate_puzzle('mudah')
+        self.assert_invariant(self.game.original_board)
+
+    def test_solved_grid(self):
+        self.assert_invariant(self.game.generate_solved_board(), transforms=2)
+
+    def test_sparse_boards(self):
+        solution = self.game.generate_solved_board()
+        for clues in (0, 1, 2, 5):
+            cells = set(self.rng.sample(range(81), clues))
+            board = [[solution[i][j] if i * 9 + j in cells else 0 for j in range(9)]
+                     for i in range(9)]
+
+            start = time.perf_counter()
+            self.assert_invariant(board, transforms=2)
+            self.assertLess(time.perf_counter() - start, 5)
+
+    def test_different_puzzles(self):
+        self.game.generate_puzzle('mudah')
+        first = [row[:] for row in self.game.original_board]
+        self.game.generate_puzzle('mudah')
+        self.assertNotEqual(canonical_form(first), canonical_form(self.game.original_board))
+
+    def test_index_rejects_equivalent_puzzle(self):
+        self.game.generate_puzzle('mudah')
+        index = PuzzleIndex()
+
+        self.assertTrue(index.add(self.game.original_board))
+        self.assertFalse(index.add(random_transform(self.game.original_board, self.rng)))
+        self.assertEqual(len(index), 1)
+
+    def test_index_find_returns_bytes(self):
+        self.game.generate_puzzle('mudah')
+        index = PuzzleIndex()
+        index.add(self.game.original_board)
+
+        stored = index.find(random_transform(self.game.original_board, self.rng))
+        self.assertEqual(stored, bytes(cell for row in self.game.original_board for cell in row))
+        self.assertIsNone(index.find(self.game.solution))
+
+    def test_generate_without_attempts(self):
+        self.game.board = [[1]]
+        self.game.generate_puzzle('mudah', max_attempts=0)
+
+        self.assertEqual(len(self.game.board), 9)
+        self.assertEqual(self.game.difficulty, 'mudah')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tes Solver Sudoku
+iter_solutions must enumerate solutions lazily and respect its limits
+"""
+
+import random
+import time
+import unittest
+
+from sudoku_game import SudokuGame
+
+
+def is_valid_solution(board):
+    """Check that every row, column and box holds 1-9 exactly once"""
+    digits = set(range(1, 10))
+    rows = [set(row) for row in board]
+    cols = [set(col) for col in zip(*board)]
+    boxes = [{board[r][c] for r in range(br, br + 3) for c in range(bc, bc + 3)}
+             for br in range(0, 9, 3) for bc in range(0, 9, 3)]
+    return all(unit == digits for unit in rows + cols + boxes)
+
+
+class IterSolutionsTest(unittest.TestCase):
+    def setUp(self):
+        random.seed(2027)
+        self.game = SudokuGame()
+        self.empty = [[0] * 9 for _ in range(9)]
+
+    def test_full_board(self):
+        solution = self.game.generate_solved_board()
+        self.assertEqual(list(self.game.iter_solutions(solution)), [solution])
+
+    def test_conflicting_givens(self):
+        board = [row[:] for row in self.empty]
+        board[0][0] = board[0][8] = 5
+        self.assertEqual(list(self.game.iter_solutions(board)), [])
+
+    def test_limit_zero(self):
+        self.assertEqual(list(self.game.iter_solutions(self.empty, limit=0)), [])
+
+    def test_limit_stops_early(self):
+        solutions = list(self.game.iter_solutions(self.empty, limit=3))
+
+        self.assertEqual(len(solutions), 3)
+        self.assertEqual(len({str(s) for s in solutions}), 3)
+        self.assertTrue(all(is_valid_solution(s) for s in solutions))
+
+    def test_time_budget_stops_early(self):
+        start = time.perf_counter()
+        for solution in self.game.iter_solutions(self.empty, time_budget=0.2):
+            self.assertTrue(is_valid_solution(solution))
+        self.assertLess(time.perf_counter() - start, 5)
+
+    def test_generated_puzzle_is_unique(self):
+        self.game.generate_puzzle('mudah')
+        self.assertEqual(self.game.count_solutions(self.game.original_board), 1)
+
+        solution = next(self.game.iter_solutions(self.game.original_board))
+        self.assertEqual(solution, self.game.solution)
+
+    def test_removed_clues_not_unique(self):
+        self.game.generate_puzzle('mudah')
+        board = [row[:] for row in self.game.original_board]
+        for row in range(1, 9):
+            board[row] = [0] * 9
+
+        self.assertEqual(self.game.count_solutions(board), 2)
+
+    def test_board_not_modified(self):
+        self.game.generate_puzzle('mudah')
+        board = [row[:] for row in self.game.original_board]
+
+        list(self.game.iter_solutions(board, limit=2))
+        self.assertEqual(board, self.game.original_board)
+
+
+if __name__ == "__main__":
+    unittest.main()